@@ -6,7 +6,7 @@ a = Analysis(
     pathex=[],
     binaries=[],
     datas=[],
-    hiddenimports=['openpyxl'],
+    hiddenimports=['openpyxl', 'python_calamine'],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
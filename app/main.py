@@ -1,4 +1,5 @@
-﻿import sys
+﻿import multiprocessing
+import sys
 from PySide6.QtWidgets import QApplication
 from app.ui.main_window import MainWindow
 
@@ -11,4 +12,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # Necesario en el ejecutable de PyInstaller si la validacion usa procesos
+    multiprocessing.freeze_support()
     main()
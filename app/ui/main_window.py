@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 from datetime import time
-from typing import List
+from typing import Callable, List, Optional
 
 import pandas as pd
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QThreadPool
 from PySide6.QtWidgets import (
+    QApplication,
     QComboBox,
     QFileDialog,
     QFrame,
@@ -16,18 +17,20 @@ from PySide6.QtWidgets import (
     QMessageBox,
     QPushButton,
     QSizePolicy,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QVBoxLayout,
     QWidget,
 )
 
+from app.ui.results_model import ResultsTableModel
+from app.ui.workers import Task
 from app.validation.engine import (
     ValidationResult,
     validate_cycles_dataframe,
     validate_dataframe,
 )
-from app.validation.rules import ALL_COLUMNS, to_time
+from app.validation.excel import read_records
+from app.validation.rules import ALL_COLUMNS, time_seconds
 
 
 ERROR_HEADERS = [*ALL_COLUMNS, "Columnas faltantes"]
@@ -177,7 +180,7 @@ QComboBox QAbstractItemView {
 }
 
 /* ── Table ────────────────────────────────────────────── */
-QTableWidget {
+QTableView {
     background: #ffffff;
     border: 1px solid #e2e8f0;
     border-top: none;
@@ -197,15 +200,15 @@ QHeaderView::section {
     font-size: 8.5pt;
 }
 QHeaderView::section:last-child { border-right: none; }
-QTableWidget::item {
+QTableView::item {
     padding: 5px 10px;
     border-bottom: 1px solid #f1f5f9;
 }
-QTableWidget::item:selected {
+QTableView::item:selected {
     background: #eff6ff;
     color: #1e40af;
 }
-QTableWidget::item:alternate { background: #f8fafc; }
+QTableView::item:alternate { background: #f8fafc; }
 
 /* ── Scrollbars ───────────────────────────────────────── */
 QScrollBar:vertical, QScrollBar:horizontal {
@@ -227,6 +230,23 @@ QScrollBar::add-line, QScrollBar::sub-line { width: 0; height: 0; }
 """
 
 
+def filter_by_time_range(df: pd.DataFrame, start_time: time, end_time: time) -> pd.DataFrame:
+    """Filas cuya Salida programada cae dentro del rango del turno."""
+    if "Salida programada" not in df.columns:
+        return df.iloc[0:0].reset_index(drop=True)
+
+    start = start_time.hour * 3600 + start_time.minute * 60 + start_time.second
+    end = end_time.hour * 3600 + end_time.minute * 60 + end_time.second
+
+    # Una sola conversion vectorizada de la columna (NaN nunca entra al rango)
+    seconds = time_seconds(df["Salida programada"])
+    if start <= end:
+        mask = (seconds >= start) & (seconds <= end)
+    else:
+        mask = (seconds >= start) | (seconds <= end)
+    return df[mask.to_numpy()].reset_index(drop=True)
+
+
 class MainWindow(QMainWindow):
     def __init__(self) -> None:
         super().__init__()
@@ -236,9 +256,18 @@ class MainWindow(QMainWindow):
 
         self.df: pd.DataFrame | None = None
         self.cycle_averages = {}
+        self._tasks: set[Task] = set()
 
         self._build_ui()
-        self.setStyleSheet(STYLESHEET)
+        self._apply_stylesheet()
+
+    @staticmethod
+    def _apply_stylesheet() -> None:
+        # Se aplica a la aplicacion y solo una vez: Qt no vuelve a parsear la
+        # hoja de estilos cada vez que se crea una ventana
+        app = QApplication.instance()
+        if app.styleSheet() != STYLESHEET:
+            app.setStyleSheet(STYLESHEET)
 
     # ─────────────────────────── Build UI ──────────────────────────────
 
@@ -368,13 +397,14 @@ class MainWindow(QMainWindow):
         rh_layout.addStretch(1)
 
         # ── Table ────────────────────────────────────────────────────────
-        self.table = QTableWidget(0, len(ERROR_HEADERS))
-        self.table.setHorizontalHeaderLabels(ERROR_HEADERS)
+        self.results_model = ResultsTableModel(ERROR_HEADERS, self)
+        self.table = QTableView()
+        self.table.setModel(self.results_model)
         self.table.setSortingEnabled(True)
         self.table.setAlternatingRowColors(True)
         self.table.verticalHeader().setVisible(False)
         self.table.setShowGrid(False)
-        self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self.table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
         h = self.table.horizontalHeader()
         h.setStretchLastSection(True)
         h.setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
@@ -402,6 +432,35 @@ class MainWindow(QMainWindow):
 
     # ─────────────────────────── Logic ─────────────────────────────────
 
+    def _start_task(
+        self,
+        task: Task,
+        on_finished: Callable[[object], None],
+        on_failed: Callable[[str], None],
+    ) -> None:
+        """Lanza la tarea fuera del hilo de la interfaz y bloquea los botones mientras corre."""
+        self._tasks.add(task)
+        self._set_busy(True)
+
+        def finish(handler: Callable, value: object) -> None:
+            self._tasks.discard(task)
+            self._set_busy(False)
+            handler(value)
+
+        task.signals.finished.connect(lambda value: finish(on_finished, value))
+        task.signals.failed.connect(lambda message: finish(on_failed, message))
+        QThreadPool.globalInstance().start(task)
+
+    def _set_busy(self, busy: bool) -> None:
+        if busy:
+            QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
+        else:
+            QApplication.restoreOverrideCursor()
+        has_data = self.df is not None
+        self.load_button.setEnabled(not busy)
+        self.validate_button.setEnabled(not busy and has_data)
+        self.cycle_button.setEnabled(not busy and has_data)
+
     def load_excel(self) -> None:
         path, _ = QFileDialog.getOpenFileName(
             self,
@@ -412,12 +471,15 @@ class MainWindow(QMainWindow):
         if not path:
             return
 
-        try:
-            df = pd.read_excel(path, engine="openpyxl", dtype=str)
-        except Exception as exc:
-            QMessageBox.critical(self, "Error", f"No se pudo leer el Excel:\n{exc}")
-            return
+        self._start_task(
+            Task(read_records, path),
+            lambda df: self._on_excel_loaded(path, df),
+            lambda message: QMessageBox.critical(
+                self, "Error", f"No se pudo leer el Excel:\n{message}"
+            ),
+        )
 
+    def _on_excel_loaded(self, path: str, df: pd.DataFrame) -> None:
         self.df = df
         self.file_label.setText(path)
         self.file_hint.setText(
@@ -425,7 +487,7 @@ class MainWindow(QMainWindow):
         )
         self.validate_button.setEnabled(True)
         self.cycle_button.setEnabled(True)
-        self.table.setRowCount(0)
+        self.results_model.set_results([])
         self.badge_widget.setVisible(False)
         self.results_title.setText("Resultados")
 
@@ -437,72 +499,59 @@ class MainWindow(QMainWindow):
             return time(14, 1), time(23, 59)
         return time(5, 0), time(14, 0)
 
-    def _filter_by_time_range(self, df: pd.DataFrame) -> pd.DataFrame:
-        start_time, end_time = self._shift_time_range()
-
-        def is_within_range(row):
-            hour_value = to_time(row.get("Salida programada"))
-            if hour_value is None:
-                return False
-            if start_time <= end_time:
-                return start_time <= hour_value <= end_time
-            return hour_value >= start_time or hour_value <= end_time
-
-        mask = df.apply(is_within_range, axis=1)
-        return df[mask].reset_index(drop=True)
+    def validate(self) -> None:
+        self._run_validation(validate_dataframe, "Validación de Incidencias", "Validación")
 
-    def _filtered_df(self) -> pd.DataFrame:
-        if self.df is None:
-            return pd.DataFrame()
-        return self._filter_by_time_range(self.df)
+    def validate_cycles(self) -> None:
+        self._run_validation(
+            validate_cycles_dataframe, "Verificador de Ciclos", "Verificador de ciclos"
+        )
 
-    def validate(self) -> None:
+    def _run_validation(
+        self,
+        validator: Callable[..., List[ValidationResult]],
+        mode: str,
+        info_title: str,
+    ) -> None:
         if self.df is None:
             QMessageBox.warning(self, "Atención", "Primero cargue un archivo Excel.")
             return
 
-        try:
-            filtered_df = self._filtered_df()
-            if filtered_df.empty:
-                self.table.setRowCount(0)
-                self._update_results_header("Validación de Incidencias", 0)
-                self._show_info(
-                    "Validación",
-                    "No hay registros en el rango del turno seleccionado.",
-                )
-                return
-            results = validate_dataframe(filtered_df, self.cycle_averages)
-        except ValueError as exc:
-            QMessageBox.critical(self, "Error", str(exc))
-            return
+        # El turno se lee aqui: los widgets solo se consultan desde el hilo de la interfaz
+        df = self.df
+        start_time, end_time = self._shift_time_range()
+        cycle_averages = dict(self.cycle_averages)
 
-        self._update_results_header("Validación de Incidencias", len(results))
-        self.populate_table(results)
-        self._show_info("Validación", f"Errores encontrados: {len(results)}")
+        def run() -> Optional[List[ValidationResult]]:
+            filtered_df = filter_by_time_range(df, start_time, end_time)
+            if filtered_df.empty:
+                return None
+            return validator(filtered_df, cycle_averages)
 
-    def validate_cycles(self) -> None:
-        if self.df is None:
-            QMessageBox.warning(self, "Atención", "Primero cargue un archivo Excel.")
-            return
+        self._start_task(
+            Task(run),
+            lambda results: self._on_validated(mode, info_title, results),
+            lambda message: QMessageBox.critical(self, "Error", message),
+        )
 
-        try:
-            filtered_df = self._filtered_df()
-            if filtered_df.empty:
-                self.table.setRowCount(0)
-                self._update_results_header("Verificador de Ciclos", 0)
-                self._show_info(
-                    "Verificador de ciclos",
-                    "No hay registros en el rango del turno seleccionado.",
-                )
-                return
-            results = validate_cycles_dataframe(filtered_df, self.cycle_averages)
-        except ValueError as exc:
-            QMessageBox.critical(self, "Error", str(exc))
+    def _on_validated(
+        self,
+        mode: str,
+        info_title: str,
+        results: Optional[List[ValidationResult]],
+    ) -> None:
+        if results is None:
+            self.results_model.set_results([])
+            self._update_results_header(mode, 0)
+            self._show_info(
+                info_title,
+                "No hay registros en el rango del turno seleccionado.",
+            )
             return
 
-        self._update_results_header("Verificador de Ciclos", len(results))
+        self._update_results_header(mode, len(results))
         self.populate_table(results)
-        self._show_info("Verificador de ciclos", f"Errores encontrados: {len(results)}")
+        self._show_info(info_title, f"Errores encontrados: {len(results)}")
 
     def _update_results_header(self, mode: str, count: int) -> None:
         self.results_title.setText(mode)
@@ -523,11 +572,11 @@ class MainWindow(QMainWindow):
 
     def _adjust_missing_column_width(self) -> None:
         missing_idx = ERROR_HEADERS.index("Columnas faltantes")
-        header_item = self.table.horizontalHeaderItem(missing_idx)
-        if header_item is None:
+        header_text = self.results_model.headerData(missing_idx, Qt.Orientation.Horizontal)
+        if header_text is None:
             return
         metrics = self.table.fontMetrics()
-        target_width = metrics.horizontalAdvance(header_item.text()) + 32
+        target_width = metrics.horizontalAdvance(header_text) + 32
         if self.table.columnWidth(missing_idx) < target_width:
             self.table.setColumnWidth(missing_idx, target_width)
 
@@ -536,14 +585,8 @@ class MainWindow(QMainWindow):
         if was_sorting:
             self.table.setSortingEnabled(False)
 
-        self.table.setRowCount(len(results))
-
-        for row_index, result in enumerate(results):
-            row_dict = result.as_dict()
-            values = [row_dict.get(header, "") for header in ERROR_HEADERS]
-            for col_index, value in enumerate(values):
-                item = QTableWidgetItem(str(value))
-                self.table.setItem(row_index, col_index, item)
+        # Sin QTableWidgetItem por celda: la vista consulta el modelo bajo demanda
+        self.results_model.set_results(results)
 
         self.table.horizontalHeader().resizeSections(
             QHeaderView.ResizeMode.ResizeToContents
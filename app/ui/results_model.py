@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from typing import List, Sequence
+
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, QPersistentModelIndex, Qt
+
+from app.validation.engine import ValidationResult
+
+
+class ResultsTableModel(QAbstractTableModel):
+    """Modelo de solo lectura sobre los resultados de validacion.
+
+    La vista solo consulta las celdas visibles, asi que no se crea un
+    QTableWidgetItem por celda al cargar miles de errores.
+
+    headers: columnas de row_values y, al final, la de columnas con error.
+    """
+
+    def __init__(self, headers: Sequence[str], parent=None) -> None:
+        super().__init__(parent)
+        self._headers = list(headers)
+        self._rows: List[List[str]] = []
+
+    def set_results(self, results: Sequence[ValidationResult]) -> None:
+        self.beginResetModel()
+        # Texto de cada fila armado una sola vez; data() y sort() solo indexan
+        columns = self._headers[:-1]
+        self._rows = [result.as_row(columns) for result in results]
+        self.endResetModel()
+
+    def rowCount(self, parent: QModelIndex | QPersistentModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QModelIndex | QPersistentModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._headers)
+
+    def data(self, index: QModelIndex | QPersistentModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or role != Qt.ItemDataRole.DisplayRole:
+            return None
+        return self._rows[index.row()][index.column()]
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return self._headers[section]
+        return section + 1
+
+    def sort(self, column: int, order: Qt.SortOrder = Qt.SortOrder.AscendingOrder) -> None:
+        # Mismo criterio que QTableWidget: comparacion de texto, orden estable
+        if not 0 <= column < len(self._headers):
+            return
+        self.layoutAboutToBeChanged.emit()
+        new_order = sorted(
+            range(len(self._rows)),
+            key=lambda i: self._rows[i][column],
+            reverse=order == Qt.SortOrder.DescendingOrder,
+        )
+        self._rows = [self._rows[i] for i in new_order]
+
+        # Mantener la seleccion sobre las mismas filas
+        new_rows = {old: new for new, old in enumerate(new_order)}
+        old_indexes = self.persistentIndexList()
+        self.changePersistentIndexList(
+            old_indexes,
+            [self.index(new_rows[i.row()], i.column()) for i in old_indexes],
+        )
+        self.layoutChanged.emit()
@@ -1,8 +1,12 @@
 ﻿from __future__ import annotations
 
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-from typing import Dict, Iterable, List, Optional
+from functools import partial
+from itertools import repeat
+from typing import Callable, Dict, Iterable, List, Optional, Sequence
 
+import numpy as np
 import pandas as pd
 
 from . import rules
@@ -19,32 +23,108 @@ class ValidationResult:
         data["Columnas faltantes"] = ", ".join(self.problem_details)
         return data
 
+    def as_row(self, columns: Sequence[str]) -> List[str]:
+        """Valores de columns y, al final, las columnas con error (orden de la tabla)."""
+        return [*(self.row_values.get(col, "") for col in columns), ", ".join(self.problem_details)]
 
-INCIDENCE_RULES = {
-    "IN1": rules.rule_in1,
-    "IN2": rules.rule_in2,
-    "IN3": rules.rule_in3,
-    "IN4": rules.rule_in4,
-    "IN5": rules.rule_in5,
-    "IN6": rules.rule_in6,
-    "IN7": rules.rule_in7,
-}
 
+# Campos interned como codigos (indice en ALL_COLUMNS) mientras se acumulan los errores
+FIELD_CODES = {field: code for code, field in enumerate(rules.ALL_COLUMNS)}
+_FIELD_NAMES = np.array(rules.ALL_COLUMNS, dtype=object)
 
-def _normalize_incidence(value) -> str:
-    if rules.is_empty(value):
-        return ""
-    # Extrae solo los primeros 3 caracteres (IN1, IN2, IN3, etc.)
-    incidence = str(value).strip().upper()
-    # Toma solo "INX" de "INX - DESCRIPCION"
-    if len(incidence) >= 3:
-        incidence = incidence[:3]
-    return incidence
+
+def _collect_issues(
+    issue_rows: List[np.ndarray],
+    issue_fields: List[int],
+    column_issues: List[rules.ColumnIssue],
+    positions: Optional[np.ndarray] = None,
+) -> None:
+    """Acumula las filas con error de cada regla (posiciones dentro del DataFrame)."""
+    for field, _message, mask in column_issues:
+        rows = np.flatnonzero(mask)
+        if positions is not None:
+            rows = positions[rows]
+        if rows.size:
+            issue_rows.append(rows)
+            issue_fields.append(FIELD_CODES[field])
+
+
+def _build_results(
+    frame: rules.NormalizedFrame,
+    issue_rows: List[np.ndarray],
+    issue_fields: List[int],
+) -> List[ValidationResult]:
+    if not issue_rows:
+        return []
+
+    # Orden estable por fila: conserva el orden en que las reglas reportan cada campo
+    rows = np.concatenate(issue_rows)
+    fields = np.concatenate([np.full(r.size, code, dtype=np.int16) for r, code in zip(issue_rows, issue_fields)])
+    order = np.argsort(rows, kind="stable")
+    rows = rows[order]
+    fields = fields[order]
+
+    # Solo mostrar el nombre de la columna (sin repetir, en orden de aparicion):
+    # se queda la primera aparicion de cada par (fila, campo)
+    _, first = np.unique(rows * len(rules.ALL_COLUMNS) + fields, return_index=True)
+    first.sort()
+    rows = rows[first]
+    names = _FIELD_NAMES[fields[first]]
+    starts = np.flatnonzero(np.r_[True, rows[1:] != rows[:-1]])
+    ends = np.r_[starts[1:], rows.size]
+
+    # Solo se convierten a texto las filas con errores
+    positions = rows[starts]
+    excel_rows = frame.data.index[positions] + 2  # encabezado + índice base 0
+    display = frame.display_values(positions)
+
+    return [
+        ValidationResult(
+            row_number=excel_row,
+            row_values=row_values,
+            problem_details=names[start:end].tolist(),
+        )
+        for excel_row, row_values, start, end in zip(excel_rows, display, starts, ends)
+    ]
+
+
+# Controles de calidad de datos (placeholders, espacios, caracteres, rangos,
+# textos); solo corren si se piden con quality_checks=True
+QUALITY_CHECKS = (
+    rules.check_suspicious_placeholders_df,
+    rules.check_extra_spaces_df,
+    rules.check_invalid_characters_df,
+    rules.check_numeric_fields_validity_df,
+    rules.check_text_field_quality_df,
+)
+
+
+def _run_partitioned(
+    validator: Callable[[pd.DataFrame, Dict[str, float]], List[ValidationResult]],
+    df: pd.DataFrame,
+    cycle_averages: Dict[str, float],
+    npartitions: Optional[int],
+) -> List[ValidationResult]:
+    """Ejecuta validator sobre df; con npartitions > 1, por bloques de filas en procesos separados.
+
+    Las reglas solo miran su propia fila: los bloques se validan por separado y
+    se concatenan en orden, con el numero de fila de Excel de cada uno.
+    """
+    if not npartitions or npartitions <= 1 or len(df) < npartitions:
+        return validator(df, cycle_averages)
+
+    bounds = np.linspace(0, len(df), npartitions + 1).astype(int)
+    parts = [df.iloc[start:end] for start, end in zip(bounds[:-1], bounds[1:])]
+    with ProcessPoolExecutor(max_workers=npartitions) as pool:
+        chunks = pool.map(validator, parts, repeat(cycle_averages))
+        return [result for chunk in chunks for result in chunk]
 
 
 def validate_dataframe(
     df: pd.DataFrame,
-    cycle_averages: Optional[Dict[str, float]] = None
+    cycle_averages: Optional[Dict[str, float]] = None,
+    npartitions: Optional[int] = None,
+    quality_checks: bool = False,
 ) -> List[ValidationResult]:
 
     # Validación de columnas obligatorias
@@ -52,89 +132,75 @@ def validate_dataframe(
     if missing:
         raise ValueError(f"Faltan columnas en el Excel: {', '.join(missing)}")
 
-    results: List[ValidationResult] = []
-    cycle_averages = cycle_averages or {}
-
-    # Campos obligatorios básicos (siempre deben estar presentes)
-    basic_required_fields = [
-        "Trayecto", "Puesto", "Salida programada", "Salida real", 
-        "Unidad", "Incidencia", "Conductor"
-    ]
+    validator = partial(_validate_rows, quality_checks=True) if quality_checks else _validate_rows
+    return _run_partitioned(validator, df, cycle_averages or {}, npartitions)
 
-    for idx, row in df.iterrows():
-        issues = []
-
-        # -------------------------
-        # Identificar la incidencia (campo principal)
-        # -------------------------
-        incidence = _normalize_incidence(row.get("Incidencia"))
-
-        # -------------------------
-        # Validaciones específicas por incidencia
-        # -------------------------
-        if incidence:
-            rule_fn = INCIDENCE_RULES.get(incidence)
-            if rule_fn is not None:
-                issues.extend(rule_fn(row))
-        else:
-            # Sin incidencia definida
-            issues.extend(rules.rule_no_incidence(row))
-
-        # -------------------------
-        # Regla global: motivo 8|65 (Robo de consola)
-        # -------------------------
-        issues.extend(rules.rule_motivo_robo_consola(row))
-
-        # Nota: Ya no se ignoran incidencias cuando Puesto == 0.
-
-        # -------------------------
-        # Regla de ciclos (promedios, si aplica)
-        # -------------------------
-        if cycle_averages:
-            issues.extend(rules.rule_cycle(row, cycle_averages))
-
-        # -------------------------
-        # Regla global: ciclo minimo
-        # -------------------------
-        issues.extend(rules.rule_min_cycle(row))
-
-        # -------------------------
-        # Si no hay errores, no se muestra la fila
-        # -------------------------
-        if not issues:
-            continue
-
-        excel_row = idx + 2  # encabezado + índice base 0
-
-        row_values = {
-            col: "" if rules.is_empty(row.get(col)) else str(row.get(col))
-            for col in rules.ALL_COLUMNS
-        }
-
-        # -------------------------
-        # Construcción del detalle de errores
-        # -------------------------
-        problem_details: List[str] = []
-
-        for field, message in issues:
-            # Solo mostrar el nombre de la columna
-            if field not in problem_details:
-                problem_details.append(field)
-
-        results.append(
-            ValidationResult(
-                row_number=excel_row,
-                row_values=row_values,
-                problem_details=problem_details,
-            )
-        )
 
-    return results
+def _validate_rows(
+    df: pd.DataFrame,
+    cycle_averages: Dict[str, float],
+    quality_checks: bool = False,
+) -> List[ValidationResult]:
+    issue_rows: List[np.ndarray] = []
+    issue_fields: List[int] = []
+
+    # -------------------------
+    # Columnas normalizadas una sola vez: celdas vacias, incidencia
+    # (campo principal, "INX" de "INX - DESCRIPCION") y horas de salida
+    # -------------------------
+    frame = rules.NormalizedFrame.from_dataframe(df)
+    incidence = frame.incidence
+
+    # -------------------------
+    # Validaciones específicas por incidencia
+    # -------------------------
+    # IN1..IN6: campos llenos/vacios y orden de salida, sobre todas las filas a la vez
+    _collect_issues(issue_rows, issue_fields, rules.rule_fields_df(frame))
+    _collect_issues(issue_rows, issue_fields, rules.rule_departure_order_df(frame))
+
+    # IN7 depende del motivo: solo sobre sus filas
+    positions = np.flatnonzero(incidence == "IN7")
+    if positions.size:
+        _collect_issues(issue_rows, issue_fields, rules.rule_in7_df(frame.take(positions)), positions)
+
+    # Sin incidencia definida
+    _collect_issues(issue_rows, issue_fields, rules.rule_no_incidence_df(frame))
+
+    # -------------------------
+    # Regla global: motivo 8|65 (Robo de consola)
+    # -------------------------
+    _collect_issues(issue_rows, issue_fields, rules.rule_motivo_robo_consola_df(frame))
+
+    # Nota: Ya no se ignoran incidencias cuando Puesto == 0.
+
+    # -------------------------
+    # Regla de ciclos (promedios, si aplica)
+    # -------------------------
+    if cycle_averages:
+        _collect_issues(issue_rows, issue_fields, rules.rule_cycle_df(frame, cycle_averages))
+
+    # -------------------------
+    # Regla global: ciclo minimo
+    # -------------------------
+    _collect_issues(issue_rows, issue_fields, rules.rule_min_cycle_df(frame))
+
+    # -------------------------
+    # Controles de calidad de datos (opcionales)
+    # -------------------------
+    if quality_checks:
+        for check in QUALITY_CHECKS:
+            _collect_issues(issue_rows, issue_fields, check(frame))
+
+    # -------------------------
+    # Solo se muestran las filas con errores
+    # -------------------------
+    return _build_results(frame, issue_rows, issue_fields)
 
 
 def validate_cycles_dataframe(
     df: pd.DataFrame,
-    cycle_averages: Optional[Dict[str, float]] = None
+    cycle_averages: Optional[Dict[str, float]] = None,
+    npartitions: Optional[int] = None,
 ) -> List[ValidationResult]:
 
     # Validación de columnas obligatorias
@@ -142,59 +208,35 @@ def validate_cycles_dataframe(
     if missing:
         raise ValueError(f"Faltan columnas en el Excel: {', '.join(missing)}")
 
-    results: List[ValidationResult] = []
-    for idx, row in df.iterrows():
-        issues = []
-
-        # Nota: Ya no se ignoran filas cuando Puesto == 0.
-
-        # -------------------------
-        # Reglas de ciclos por ruta
-        # -------------------------
-        issues.extend(rules.rule_cycle_route_limits(row))
-
-        # -------------------------
-        # Regla global: motivo 8|65 (Robo de consola)
-        # -------------------------
-        issues.extend(rules.rule_motivo_robo_consola(row))
-
-        # -------------------------
-        # Regla global: ciclo minimo
-        # -------------------------
-        issues.extend(rules.rule_min_cycle(row))
-
-        # -------------------------
-        # Si no hay errores, no se muestra la fila
-        # -------------------------
-        if not issues:
-            continue
-
-        excel_row = idx + 2  # encabezado + índice base 0
-
-        row_values = {
-            col: "" if rules.is_empty(row.get(col)) else str(row.get(col))
-            for col in rules.ALL_COLUMNS
-        }
-
-        # -------------------------
-        # Construcción del detalle de errores
-        # -------------------------
-        problem_details: List[str] = []
-
-        for field, message in issues:
-            # Solo mostrar el nombre de la columna
-            if field not in problem_details:
-                problem_details.append(field)
-
-        results.append(
-            ValidationResult(
-                row_number=excel_row,
-                row_values=row_values,
-                problem_details=problem_details,
-            )
-        )
+    return _run_partitioned(_validate_cycle_rows, df, cycle_averages or {}, npartitions)
+
+
+def _validate_cycle_rows(df: pd.DataFrame, cycle_averages: Dict[str, float]) -> List[ValidationResult]:
+    issue_rows: List[np.ndarray] = []
+    issue_fields: List[int] = []
+    frame = rules.NormalizedFrame.from_dataframe(df)
+
+    # Nota: Ya no se ignoran filas cuando Puesto == 0.
+
+    # -------------------------
+    # Reglas de ciclos por ruta
+    # -------------------------
+    _collect_issues(issue_rows, issue_fields, rules.rule_cycle_route_limits_df(frame))
+
+    # -------------------------
+    # Regla global: motivo 8|65 (Robo de consola)
+    # -------------------------
+    _collect_issues(issue_rows, issue_fields, rules.rule_motivo_robo_consola_df(frame))
+
+    # -------------------------
+    # Regla global: ciclo minimo
+    # -------------------------
+    _collect_issues(issue_rows, issue_fields, rules.rule_min_cycle_df(frame))
 
-    return results
+    # -------------------------
+    # Si no hay errores, no se muestra la fila
+    # -------------------------
+    return _build_results(frame, issue_rows, issue_fields)
 
 
 def errors_to_dataframe(results: Iterable[ValidationResult]) -> pd.DataFrame:
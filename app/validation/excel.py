@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import pandas as pd
+
+from .rules import ALL_COLUMNS, TEXT_DTYPE
+
+try:
+    import python_calamine  # noqa: F401
+except ImportError:
+    EXCEL_ENGINE = "openpyxl"
+    # Modo solo lectura: openpyxl recorre el XML por eventos en vez de armar el
+    # libro completo en memoria (pandas ya lo usa por defecto; se deja fijo)
+    ENGINE_KWARGS = {"read_only": True, "data_only": True, "keep_links": False}
+else:
+    # Lector en Rust: bastante mas rapido y con menos memoria que openpyxl
+    EXCEL_ENGINE = "calamine"
+    ENGINE_KWARGS = {}
+
+_KNOWN_COLUMNS = frozenset(ALL_COLUMNS)
+
+# Columnas con pocos valores distintos: como category se guardan como codigos enteros
+CATEGORY_COLUMNS = ("Trayecto", "Puesto", "Unidad", "Incidencia", "Motivo", "Código", "Conductor")
+
+# Duracion como la escribe pd.Timedelta ("0 days 00:20:00")
+_TIMEDELTA_TEXT = r"-?[0-9]+ days? [0-9]{2}:[0-9]{2}:[0-9]{2}(?:\.[0-9]+)?"
+
+
+def _duration_text(values: pd.Series) -> pd.Series:
+    """Celdas de duracion ([h]:mm) como "H:MM:SS", igual que las lee openpyxl.
+
+    Con pandas 2.x, calamine entrega las duraciones como pd.Timedelta y dtype=str
+    las deja como "0 days 00:20:00", que to_time/to_minutes no interpretan.
+    """
+    # Filtro barato antes de la expresion regular: casi ninguna celda es duracion
+    found = values.str.contains(" day", regex=False, na=False)
+    if found.any():
+        found &= values.str.fullmatch(_TIMEDELTA_TEXT, na=False)
+    if not found.any():
+        return values
+    durations = pd.to_timedelta(values[found])
+    return values.mask(found, durations.map(lambda value: str(value.to_pytimedelta())))
+
+
+def read_records(path: str) -> pd.DataFrame:
+    """Lee el Excel como texto, solo con las columnas que usan las validaciones."""
+    # usecols como funcion: si falta una columna no falla aqui, la validacion la reporta
+    df = pd.read_excel(
+        path,
+        engine=EXCEL_ENGINE,
+        engine_kwargs=ENGINE_KWARGS,
+        dtype=str,
+        usecols=lambda column: column in _KNOWN_COLUMNS,
+    )
+    df = df.apply(_duration_text)
+    dtypes = {col: "category" for col in CATEGORY_COLUMNS if col in df.columns}
+    if TEXT_DTYPE:
+        # Solo columnas object (pandas 2.x); en pandas 3 "str" ya usa Arrow
+        dtypes.update({
+            col: TEXT_DTYPE for col in df.columns
+            if col not in dtypes and df[col].dtype == object
+        })
+    return df.astype(dtypes)
@@ -1,11 +1,22 @@
 ﻿from __future__ import annotations
 
+from dataclasses import dataclass
 from datetime import datetime, time, timedelta
+from functools import cached_property, lru_cache
 import re
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
+try:
+    import pyarrow  # noqa: F401
+except ImportError:
+    TEXT_DTYPE = None
+else:
+    # Texto en buffers de Arrow: strip/upper/isin usan los kernels de Arrow
+    TEXT_DTYPE = "string[pyarrow]"
+
 ALL_COLUMNS = [
     "Trayecto",
     "Puesto",
@@ -24,21 +35,35 @@ ALL_COLUMNS = [
     "Observaciones",
 ]
 
+# Campos obligatorios / permitidos por incidencia (se calculan una sola vez)
+_IN1234_REQUIRED = tuple(c for c in ALL_COLUMNS if c not in {"Unidad saliente", "Hora cambio", "Parada"})
+_IN5_REQUIRED = tuple(c for c in ALL_COLUMNS if c != "Parada")
+_IN7_REQUIRED = tuple(c for c in ALL_COLUMNS if c != "Unidad saliente")
+_IN7_835_REQUIRED = tuple(c for c in _IN7_REQUIRED if c != "Hora cambio")
+_IN1_FORBIDDEN = ("Unidad saliente",)
+_IN234_FORBIDDEN = ("Unidad saliente", "Hora cambio", "Parada")
+_IN5_FORBIDDEN = ("Parada",)
+_IN7_835_FORBIDDEN = ("Unidad saliente", "Hora cambio")
+_IN7_829_FORBIDDEN = ("Unidad saliente",)
+_IN6_ALLOWED = frozenset({"Trayecto", "Puesto", "Salida programada", "Incidencia", "Motivo", "Observaciones"})
+_IN6_FORBIDDEN = tuple(c for c in ALL_COLUMNS if c not in _IN6_ALLOWED)
+
 
 def is_empty(value: Any) -> bool:
-    if value is None:
+    if value is None or value is pd.NA:
         return True
-    try:
-        if pd.isna(value):
-            return True
-    except Exception:
-        pass
     if isinstance(value, str):
         # Normalizar cadenas
-        clean = value.strip().lower()
-        if clean == "" or clean == "nan":
-            return True
-    return False
+        clean = value.strip()
+        return clean == "" or clean.lower() == "nan"
+    if isinstance(value, float):
+        # NaN es el unico valor distinto de si mismo (evita pd.isna)
+        return value != value
+    # Resto de tipos (NaT, numpy, etc.)
+    try:
+        return bool(pd.isna(value))
+    except Exception:
+        return False
 
 
 def to_time(value: Any) -> Optional[time]:
@@ -55,14 +80,85 @@ def to_time(value: Any) -> Optional[time]:
             seconds = int(round(value * 24 * 60 * 60))
             return (datetime(1900, 1, 1) + timedelta(seconds=seconds)).time()
     if isinstance(value, str):
-        ts = pd.to_datetime(value, errors="coerce")
-        if pd.isna(ts):
-            return None
-        if isinstance(ts, pd.Timestamp):
-            return ts.to_pydatetime().time()
+        return _parse_time_text(value)
+    return None
+
+
+@lru_cache(maxsize=4096)
+def _parse_time_text(value: str) -> Optional[time]:
+    # Las horas se repiten mucho: cada texto se interpreta una sola vez
+    ts = pd.to_datetime(value, errors="coerce")
+    if pd.isna(ts):
+        return None
+    if isinstance(ts, pd.Timestamp):
+        return ts.to_pydatetime().time()
     return None
 
 
+def _time_to_seconds(value: Optional[time]) -> float:
+    if value is None:
+        return float("nan")
+    return value.hour * 3600 + value.minute * 60 + value.second + value.microsecond / 1_000_000
+
+
+def time_seconds(values: pd.Series) -> pd.Series:
+    """Version vectorizada de to_time: segundos desde medianoche (NaN si no es valida)."""
+    if pd.api.types.is_datetime64_any_dtype(values.dtype):
+        ts = values
+    elif pd.api.types.is_numeric_dtype(values.dtype) and not pd.api.types.is_bool_dtype(values.dtype):
+        # Fraccion de dia (Excel) -> segundos redondeados, igual que to_time
+        num = values.astype("float64")
+        return (num * 24 * 60 * 60).round().where((num >= 0) & (num < 1))
+    else:
+        if pd.api.types.infer_dtype(values, skipna=True) in {"string", "empty"}:
+            is_str = values.notna()
+        else:
+            is_str = values.map(lambda v: isinstance(v, str)).astype(bool)
+        # Cada texto distinto se interpreta una sola vez (codigo -1 = no texto)
+        codes, uniques = pd.factorize(values.where(is_str))
+        parsed = _text_seconds(pd.Series(uniques, dtype=object))
+        seconds = pd.Series(np.append(parsed, np.nan)[codes], index=values.index)
+        if not is_str.all():
+            # Valores no texto (time, datetime, numeros): ruta escalar
+            others = values[~is_str].map(lambda v: _time_to_seconds(to_time(v)))
+            seconds[~is_str] = others.astype("float64")
+        return seconds
+    return _datetime_seconds(ts)
+
+
+# Formatos habituales del Excel; lo que no calce se interpreta con to_time
+_TIME_FORMATS = ("%H:%M:%S", "%H:%M", "%Y-%m-%d %H:%M:%S")
+# Textos que esos formatos leen igual que to_time: minutos y segundos con dos
+# digitos y hasta 59 (en pandas 2.x %M/%S aceptan "7", y %S acepta 60 y 61)
+_EXPLICIT_TIME_RE = r"(?:[0-9]{4}-[0-9]{2}-[0-9]{2} )?[0-9]{1,2}:[0-5][0-9](?::[0-5][0-9])?"
+
+
+def _text_seconds(text: pd.Series) -> np.ndarray:
+    """Segundos desde medianoche de cada texto (NaN si to_time no lo acepta)."""
+    explicit = text.where(text.str.fullmatch(_EXPLICIT_TIME_RE, na=False))
+    ts = pd.to_datetime(explicit, errors="coerce", format=_TIME_FORMATS[0])
+    for fmt in _TIME_FORMATS[1:]:
+        pending = ts.isna() & explicit.notna()
+        if not pending.any():
+            break
+        ts[pending] = pd.to_datetime(explicit[pending], errors="coerce", format=fmt)
+    seconds = _datetime_seconds(ts).to_numpy(copy=True)
+    # El resto (zonas horarias, otros formatos): to_time texto por texto, ya
+    # que un solo to_datetime con zonas mezcladas falla para toda la columna
+    pending = np.isnan(seconds) & text.notna().to_numpy()
+    seconds[pending] = [_time_to_seconds(_parse_time_text(value)) for value in text[pending]]
+    return seconds
+
+
+def _datetime_seconds(ts: pd.Series) -> pd.Series:
+    return (
+        ts.dt.hour * 3600
+        + ts.dt.minute * 60
+        + ts.dt.second
+        + ts.dt.microsecond / 1_000_000
+    ).astype("float64")
+
+
 def to_int(value: Any) -> Optional[int]:
     if is_empty(value):
         return None
@@ -138,7 +234,7 @@ def to_minutes(value: Any) -> Optional[float]:
     return num
 
 
-def check_required(row: pd.Series, required_fields: Iterable[str], rule: str) -> List[Tuple[str, str]]:
+def check_required(row: pd.Series, required_fields: Tuple[str, ...], rule: str) -> List[Tuple[str, str]]:
     issues: List[Tuple[str, str]] = []
     for field in required_fields:
         if is_empty(row.get(field)):
@@ -146,7 +242,7 @@ def check_required(row: pd.Series, required_fields: Iterable[str], rule: str) ->
     return issues
 
 
-def check_must_be_empty(row: pd.Series, empty_fields: Iterable[str], rule: str) -> List[Tuple[str, str]]:
+def check_must_be_empty(row: pd.Series, empty_fields: Tuple[str, ...], rule: str) -> List[Tuple[str, str]]:
     issues: List[Tuple[str, str]] = []
     for field in empty_fields:
         if not is_empty(row.get(field)):
@@ -158,8 +254,7 @@ def rule_in1(row: pd.Series) -> List[Tuple[str, str]]:
     issues: List[Tuple[str, str]] = []
     
     # Campos obligatorios para IN1 (todos excepto Unidad saliente, Hora cambio y Parada)
-    required = [c for c in ALL_COLUMNS if c not in {"Unidad saliente", "Hora cambio", "Parada"}]
-    issues.extend(check_required(row, required, "IN1"))
+    issues.extend(check_required(row, _IN1234_REQUIRED, "IN1"))
     
     # Unidad saliente no debe tener datos
     if not is_empty(row.get("Unidad saliente")):
@@ -172,11 +267,10 @@ def rule_in2(row: pd.Series) -> List[Tuple[str, str]]:
     issues: List[Tuple[str, str]] = []
     
     # Campos obligatorios para IN2 (todos excepto Unidad saliente, Hora cambio y Parada)
-    required = [c for c in ALL_COLUMNS if c not in {"Unidad saliente", "Hora cambio", "Parada"}]
-    issues.extend(check_required(row, required, "IN2"))
+    issues.extend(check_required(row, _IN1234_REQUIRED, "IN2"))
     
     # Estos campos no deben tener datos
-    issues.extend(check_must_be_empty(row, ["Unidad saliente", "Hora cambio", "Parada"], "IN2"))
+    issues.extend(check_must_be_empty(row, _IN234_FORBIDDEN, "IN2"))
     
     # Validar que Salida real sea antes que Salida programada (adelantada)
     t_prog = to_time(row.get("Salida programada"))
@@ -193,11 +287,10 @@ def rule_in3(row: pd.Series) -> List[Tuple[str, str]]:
     issues: List[Tuple[str, str]] = []
     
     # Campos obligatorios para IN3 (todos excepto Unidad saliente, Hora cambio y Parada)
-    required = [c for c in ALL_COLUMNS if c not in {"Unidad saliente", "Hora cambio", "Parada"}]
-    issues.extend(check_required(row, required, "IN3"))
+    issues.extend(check_required(row, _IN1234_REQUIRED, "IN3"))
     
     # Estos campos no deben tener datos
-    issues.extend(check_must_be_empty(row, ["Unidad saliente", "Hora cambio", "Parada"], "IN3"))
+    issues.extend(check_must_be_empty(row, _IN234_FORBIDDEN, "IN3"))
     
     # Validar que Salida real sea después que Salida programada (atrasada)
     t_prog = to_time(row.get("Salida programada"))
@@ -214,11 +307,10 @@ def rule_in4(row: pd.Series) -> List[Tuple[str, str]]:
     issues: List[Tuple[str, str]] = []
     
     # Campos obligatorios para IN4 (todos excepto Unidad saliente, Hora cambio y Parada)
-    required = [c for c in ALL_COLUMNS if c not in {"Unidad saliente", "Hora cambio", "Parada"}]
-    issues.extend(check_required(row, required, "IN4"))
+    issues.extend(check_required(row, _IN1234_REQUIRED, "IN4"))
     
     # Estos campos no deben tener datos
-    issues.extend(check_must_be_empty(row, ["Unidad saliente", "Hora cambio", "Parada"], "IN4"))
+    issues.extend(check_must_be_empty(row, _IN234_FORBIDDEN, "IN4"))
     
     # Validar que Salida real sea después que Salida programada
     t_prog = to_time(row.get("Salida programada"))
@@ -232,19 +324,15 @@ def rule_in4(row: pd.Series) -> List[Tuple[str, str]]:
 
 
 def rule_in5(row: pd.Series) -> List[Tuple[str, str]]:
-    required = [c for c in ALL_COLUMNS if c not in {"Parada"}]
-    issues = check_required(row, required, "IN5")
-    issues += check_must_be_empty(row, ["Parada"], "IN5")
+    issues = check_required(row, _IN5_REQUIRED, "IN5")
+    issues += check_must_be_empty(row, _IN5_FORBIDDEN, "IN5")
     return issues
 
 
 def rule_in6(row: pd.Series) -> List[Tuple[str, str]]:
     issues: List[Tuple[str, str]] = []
-    allowed = {"Trayecto", "Puesto", "Salida programada", "Incidencia", "Motivo", "Observaciones"}
     
-    for field in ALL_COLUMNS:
-        if field in allowed:
-            continue
+    for field in _IN6_FORBIDDEN:
         value = row.get(field)
         if not is_empty(value):
             issues.append((
@@ -264,17 +352,14 @@ def rule_in7(row: pd.Series) -> List[Tuple[str, str]]:
 
     # Campos obligatorios: todos excepto Unidad saliente.
     # Para motivo 8|35, Hora cambio tampoco es obligatoria (debe ir vacia).
-    required_exclusions = {"Unidad saliente"}
-    if is_8_35:
-        required_exclusions.add("Hora cambio")
-    required = [c for c in ALL_COLUMNS if c not in required_exclusions]
+    required = _IN7_835_REQUIRED if is_8_35 else _IN7_REQUIRED
     issues.extend(check_required(row, required, "IN7"))
 
     # Reglas segun motivo
     if is_8_35:
-        issues.extend(check_must_be_empty(row, ["Unidad saliente", "Hora cambio"], "IN7"))
+        issues.extend(check_must_be_empty(row, _IN7_835_FORBIDDEN, "IN7"))
     elif is_8_29:
-        issues.extend(check_must_be_empty(row, ["Unidad saliente"], "IN7"))
+        issues.extend(check_must_be_empty(row, _IN7_829_FORBIDDEN, "IN7"))
         if to_time(row.get("Hora cambio")) is None:
             issues.append(("Hora cambio", "IN7: Hora cambio obligatorio para motivo 8-29"))
     return issues
@@ -306,19 +391,29 @@ def rule_motivo_robo_consola(row: pd.Series) -> List[Tuple[str, str]]:
     return issues
 
 
+_DASHES = str.maketrans({"–": "-", "—": "-"})
+_SPACES_RE = re.compile(r"\s+")
+_DASH_SPACES_RE = re.compile(r"\s*-\s*")
+
+
 def normalize_recorrido(value: Any) -> Optional[str]:
     if is_empty(value):
         return None
-    text = str(value).strip().casefold()
+    return _normalize_recorrido_text(str(value))
+
+
+@lru_cache(maxsize=1024)
+def _normalize_recorrido_text(value: str) -> Optional[str]:
+    # Pocos trayectos distintos: cada texto se normaliza una sola vez
+    text = value.strip().casefold()
     if not text:
         return None
     # Unificar tipos de guiones a "-"
-    text = text.replace("–", "-").replace("—", "-")
+    text = text.translate(_DASHES)
     # Compactar espacios
-    text = re.sub(r"\s+", " ", text)
+    text = _SPACES_RE.sub(" ", text)
     # Quitar espacios alrededor de guion
-    text = re.sub(r"\s*-\s*", "-", text)
-    return text
+    return _DASH_SPACES_RE.sub("-", text)
 
 
 ROUTE_CYCLE_LIMITS = {
@@ -350,6 +445,27 @@ ROUTE_CYCLE_LIMITS = {
 }
 
 
+# Limites en minutos, calculados una sola vez
+ROUTE_CYCLE_LIMITS_MINUTES = {
+    route: limit.hour * 60 + limit.minute + (limit.second / 60)
+    for route, limit in ROUTE_CYCLE_LIMITS.items()
+}
+
+# Rutas de la mas larga a la mas corta (orden estable: en empate gana la
+# primera del diccionario, igual que max(..., key=len))
+_ROUTES_BY_LENGTH = tuple(sorted(ROUTE_CYCLE_LIMITS, key=len, reverse=True))
+
+
+@lru_cache(maxsize=1024)
+def _route_key(recorrido: str) -> Optional[str]:
+    """Ruta de ROUTE_CYCLE_LIMITS que aplica a un recorrido ya normalizado (None si no hay)."""
+    if recorrido in ROUTE_CYCLE_LIMITS:
+        return recorrido
+    # Fallback: la ruta mas larga contenida (ej: "terminal guasmo-terminal guasmo-s1");
+    # la primera que aparezca ya es la mas larga
+    return next((key for key in _ROUTES_BY_LENGTH if key in recorrido), None)
+
+
 def rule_cycle_route_limits(row: pd.Series) -> List[Tuple[str, str]]:
     issues: List[Tuple[str, str]] = []
     if normalize_incidence(row.get("Incidencia")) == "IN6":
@@ -358,22 +474,17 @@ def rule_cycle_route_limits(row: pd.Series) -> List[Tuple[str, str]]:
     if not recorrido:
         return issues
 
-    limit = ROUTE_CYCLE_LIMITS.get(recorrido)
-    if limit is None:
-        # Fallback: coincide por substring (ej: "terminal guasmo-terminal guasmo-s1")
-        matches = [key for key in ROUTE_CYCLE_LIMITS if key in recorrido]
-        if not matches:
-            return issues
-        best_key = max(matches, key=len)
-        limit = ROUTE_CYCLE_LIMITS[best_key]
+    key = _route_key(recorrido)
+    if key is None:
+        return issues
+    limit = ROUTE_CYCLE_LIMITS[key]
 
     ciclo_minutes = to_minutes(row.get("Ciclo"))
     if ciclo_minutes is None:
         issues.append(("Ciclo", f"Ciclo obligatorio para {recorrido}"))
         return issues
 
-    limit_minutes = limit.hour * 60 + limit.minute + (limit.second / 60)
-    if ciclo_minutes > limit_minutes:
+    if ciclo_minutes > ROUTE_CYCLE_LIMITS_MINUTES[key]:
         issues.append(("Ciclo", f"Ciclo supera limite {limit.strftime('%H:%M')} para {recorrido}"))
     return issues
 
@@ -415,17 +526,31 @@ def rule_min_cycle(row: pd.Series, min_minutes: float = 5.0) -> List[Tuple[str,
 # Nuevas reglas para detectar errores humanos
 # =========================================
 
+_SUSPICIOUS_VALUES = frozenset({"N/A", "NA", "ERROR", "---", "...", "XXX", "SIN DATO", "POR LLENAR", "TEMP"})
+# Campos que solo deberían contener números y caracteres básicos
+_NUMERIC_FIELDS = ("Unidad", "Puesto", "Código", "Trayecto")
+_NUMERIC_RANGES = {
+    "Puesto": (1, 999),
+    "Unidad": (1, 99999),
+    "Código": (1, 999),
+}
+_NUMERIC_MIN, _NUMERIC_MAX = np.array(list(_NUMERIC_RANGES.values()), dtype="float64").T
+_TEXT_FIELDS = ("Conductor", "Motivo")
+_INVALID_CHARS = frozenset("@#$%&*!¡")
+# Tres caracteres iguales seguidos ("aaa", ..., "999"); solo minusculas y digitos
+_TRIPLE_RE = re.compile(r"([a-z0-9])\1\1")
+
+
 def check_suspicious_placeholders(row: pd.Series) -> List[Tuple[str, str]]:
     """Detecta valores placeholders comunes que indican errores de digitación"""
     issues: List[Tuple[str, str]] = []
-    suspicious_values = ["N/A", "NA", "ERROR", "---", "...", "XXX", "SIN DATO", "POR LLENAR", "TEMP"]
     
     for field in ALL_COLUMNS:
         value = row.get(field)
         if is_empty(value):
             continue
         value_str = str(value).strip().upper()
-        if value_str in suspicious_values:
+        if value_str in _SUSPICIOUS_VALUES:
             issues.append((field, f"Valor sospechoso: '{value}' (parece un placeholder)"))
     
     return issues
@@ -451,16 +576,14 @@ def check_invalid_characters(row: pd.Series) -> List[Tuple[str, str]]:
     """Detecta caracteres inválidos o extraños en campos específicos"""
     issues: List[Tuple[str, str]] = []
     
-    # Campos que solo deberían contener números y caracteres básicos
-    numeric_fields = {"Unidad", "Puesto", "Código", "Trayecto"}
-    for field in numeric_fields:
+    for field in _NUMERIC_FIELDS:
         value = row.get(field)
         if is_empty(value):
             continue
         value_str = str(value).strip()
         
         # Detectar caracteres especiales sospechosos
-        if any(char in value_str for char in ["@", "#", "$", "%", "&", "*", "!", "¡"]):
+        if not _INVALID_CHARS.isdisjoint(value_str):
             issues.append((field, f"Contiene caracteres inválidos: '{value}'"))
     
     return issues
@@ -470,13 +593,7 @@ def check_numeric_fields_validity(row: pd.Series) -> List[Tuple[str, str]]:
     """Valida que campos numéricos tengan valores válidos"""
     issues: List[Tuple[str, str]] = []
     
-    numeric_checks = {
-        "Puesto": (1, 999),
-        "Unidad": (1, 99999),
-        "Código": (1, 999),
-    }
-    
-    for field, (min_val, max_val) in numeric_checks.items():
+    for field, (min_val, max_val) in _NUMERIC_RANGES.items():
         value = row.get(field)
         if is_empty(value):
             continue
@@ -494,9 +611,7 @@ def check_text_field_quality(row: pd.Series) -> List[Tuple[str, str]]:
     """Detecta problemas de calidad en campos de texto"""
     issues: List[Tuple[str, str]] = []
     
-    text_fields = {"Conductor", "Motivo"}
-    
-    for field in text_fields:
+    for field in _TEXT_FIELDS:
         value = row.get(field)
         if is_empty(value):
             continue
@@ -508,11 +623,11 @@ def check_text_field_quality(row: pd.Series) -> List[Tuple[str, str]]:
             issues.append((field, "El conductor debe ser un nombre, no solo números"))
         
         # Detectar textos muy cortos (posible error)
-        if len(value_str) < 2 and field in {"Conductor", "Motivo"}:
+        if len(value_str) < 2:
             issues.append((field, "Texto muy corto (posible error de digitación)"))
         
         # Detectar duplicados de caracteres (typos comunes)
-        if any(char * 3 in value_str for char in "abcdefghijklmnopqrstuvwxyz0123456789"):
+        if _TRIPLE_RE.search(value_str):
             issues.append((field, "Contiene caracteres repetidos excesivamente"))
     
     return issues
@@ -527,3 +642,424 @@ def check_for_empty_required_fields(row: pd.Series, required_fields: List[str])
             issues.append((field, "Campo obligatorio vacío"))
     
     return issues
+
+
+# =========================================
+# Reglas por columnas (validacion vectorizada)
+# =========================================
+# Cada regla recibe el bloque de filas al que aplica y devuelve
+# (campo, mensaje, mascara) con una mascara booleana por fila del bloque.
+
+ColumnIssue = Tuple[str, str, np.ndarray]
+
+
+def as_text(values: pd.Series) -> pd.Series:
+    """Columna como texto (Arrow si esta disponible), una sola conversion por columna."""
+    return values.astype(TEXT_DTYPE or str)
+
+
+def is_empty_series(values: pd.Series, stripped: Optional[pd.Series] = None) -> pd.Series:
+    """Version vectorizada de is_empty para una columna completa.
+
+    stripped: values como texto sin espacios extremos, si ya se calculo.
+    """
+    if pd.api.types.is_numeric_dtype(values.dtype):
+        # Columna de numeros: solo NaN/NA cuenta como vacia, sin pasar por texto
+        return values.isna()
+    if stripped is None:
+        stripped = as_text(values).str.strip()
+    return values.isna() | stripped.str.lower().isin(["", "nan"])
+
+
+def text_matrix(df: pd.DataFrame, fields: Iterable[str]) -> Tuple[pd.DataFrame, Dict[str, np.ndarray]]:
+    """Texto sin espacios extremos ("" si la celda esta vacia) y mascara de vacias por campo."""
+    # Se recorren las columnas (pocas), nunca las filas; cada celda se
+    # convierte a texto una sola vez para todas las reglas
+    stripped: Dict[str, pd.Series] = {}
+    empty: Dict[str, np.ndarray] = {}
+    for field in fields:
+        text = as_text(df[field]).str.strip()
+        empty[field] = is_empty_series(df[field], text).to_numpy(dtype=bool)
+        stripped[field] = text.mask(empty[field], "")
+    return pd.DataFrame(stripped, index=df.index), empty
+
+
+@dataclass
+class NormalizedFrame:
+    """Columnas precalculadas una sola vez por DataFrame para las reglas vectorizadas."""
+
+    data: pd.DataFrame
+    # Texto de ALL_COLUMNS sin espacios extremos ("" si la celda esta vacia)
+    stripped: pd.DataFrame
+    # Celdas vacias segun is_empty: un arreglo booleano por campo de ALL_COLUMNS
+    empty: Dict[str, np.ndarray]
+    # Codigo de incidencia normalizado ("IN1", ..., "" si esta vacia)
+    incidence: np.ndarray
+    # Salida programada / Salida real en segundos desde medianoche (NaN si no es valida)
+    t_prog: np.ndarray
+    t_real: np.ndarray
+
+    @classmethod
+    def from_dataframe(cls, df: pd.DataFrame) -> "NormalizedFrame":
+        stripped, empty = text_matrix(df, ALL_COLUMNS)
+        return cls(
+            data=df,
+            stripped=stripped,
+            empty=empty,
+            # "INX - DESCRIPCION" -> "INX" (igual que normalize_incidence)
+            incidence=stripped["Incidencia"].str.upper().str.slice(0, 3).to_numpy(dtype=object),
+            t_prog=time_seconds(df["Salida programada"]).to_numpy(),
+            t_real=time_seconds(df["Salida real"]).to_numpy(),
+        )
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def take(self, positions: np.ndarray) -> "NormalizedFrame":
+        """Bloque de filas (por posicion) al que aplica una regla."""
+        return NormalizedFrame(
+            data=self.data.iloc[positions],
+            stripped=self.stripped.iloc[positions],
+            empty={field: mask[positions] for field, mask in self.empty.items()},
+            incidence=self.incidence[positions],
+            t_prog=self.t_prog[positions],
+            t_real=self.t_real[positions],
+        )
+
+    def is_empty(self, field: str) -> np.ndarray:
+        return self.empty[field]
+
+    def empty_columns(self, fields: Iterable[str]) -> np.ndarray:
+        """Matriz booleana (fila, campo) de celdas vacias."""
+        return np.column_stack([self.empty[field] for field in fields])
+
+    @cached_property
+    def departure_delta(self) -> np.ndarray:
+        """Salida real - Salida programada en segundos (NaN si alguna no es valida)."""
+        return self.t_real - self.t_prog
+
+    @cached_property
+    def upper(self) -> pd.DataFrame:
+        """stripped en mayusculas (solo si alguna regla lo usa)."""
+        return pd.DataFrame({field: self.stripped[field].str.upper() for field in ALL_COLUMNS}, index=self.data.index)
+
+    @cached_property
+    def motivo_codes(self) -> Tuple[np.ndarray, np.ndarray]:
+        """parse_motivo_code de Motivo por fila: (codigo principal, subcodigo)."""
+        # Se interpreta cada valor distinto una vez y se separa la tupla por
+        # valor distinto; las filas solo copian por codigo
+        codes, uniques = pd.factorize(self.data["Motivo"])
+        parsed = [parse_motivo_code(value) for value in uniques]
+        parsed.append(parse_motivo_code(None))  # celdas vacias (codigo -1)
+        motivo_main = np.array([code[0] for code in parsed], dtype=object)
+        motivo_sub = np.array([code[1] for code in parsed], dtype=object)
+        return motivo_main[codes], motivo_sub[codes]
+
+    @cached_property
+    def ciclo_number(self) -> pd.Series:
+        """Ciclo como numero; lo comparten las reglas de ciclo."""
+        return to_float_series(self.data["Ciclo"])
+
+    @cached_property
+    def ciclo_minutes(self) -> np.ndarray:
+        """Ciclo en minutos (to_minutes), NaN si no es valido."""
+        return to_minutes_series(self.data["Ciclo"], self.ciclo_number).to_numpy()
+
+    def display_values(self, positions: np.ndarray) -> List[Dict[str, str]]:
+        """Valores de ALL_COLUMNS como texto ("" si la celda esta vacia) para las filas indicadas."""
+        text = self.data[ALL_COLUMNS].iloc[positions].astype(str)
+        text = text.mask(self.empty_columns(ALL_COLUMNS)[positions], "")
+        # Columnas como listas y dict(zip) por fila: to_dict(orient="records")
+        # revisa el tipo de cada celda y es varias veces mas lento
+        columns = [text[field].tolist() for field in ALL_COLUMNS]
+        return [dict(zip(ALL_COLUMNS, values)) for values in zip(*columns)]
+
+
+def map_unique(values: pd.Series, fn: Callable[[Any], Any]) -> np.ndarray:
+    """Aplica fn una sola vez por valor distinto (o por categoria) y lo expande a las filas."""
+    codes, uniques = pd.factorize(values)
+    mapped = np.empty(len(uniques) + 1, dtype=object)
+    mapped[:-1] = [fn(value) for value in uniques]
+    mapped[-1] = fn(None)  # celdas vacias (codigo -1)
+    return mapped[codes]
+
+
+def to_float_series(values: pd.Series) -> pd.Series:
+    """Version vectorizada de to_float (NaN si no es numero)."""
+    # Se decide por el tipo de la columna, no celda por celda
+    if pd.api.types.is_numeric_dtype(values.dtype):
+        # Ya son numeros (o booleanos): NaN/NA = celda vacia
+        return values.astype("float64")
+    if pd.api.types.is_datetime64_any_dtype(values.dtype) or pd.api.types.is_timedelta64_dtype(values.dtype):
+        # float() no acepta fechas ni duraciones
+        return pd.Series(np.nan, index=values.index)
+    return pd.to_numeric(values.mask(is_empty_series(values)), errors="coerce").astype("float64")
+
+
+def to_minutes_series(values: pd.Series, numbers: Optional[pd.Series] = None) -> pd.Series:
+    """Version vectorizada de to_minutes (NaN si no es valido).
+
+    numbers: to_float_series(values) si ya se calculo.
+    """
+    # to_minutes ignora los microsegundos de la hora
+    minutes = np.floor(time_seconds(values)) / 60
+    num = to_float_series(values) if numbers is None else numbers
+    # Fracción de día (Excel) -> minutos
+    num = num.where(~((num >= 0) & (num < 1)), num * 24 * 60)
+    return minutes.fillna(num)
+
+
+def check_required_df(frame: NormalizedFrame, required_fields: Tuple[str, ...], rule: str) -> List[ColumnIssue]:
+    return [(field, f"{rule}: Campo obligatorio", frame.is_empty(field)) for field in required_fields]
+
+
+# IN1..IN6 solo revisan que campos van llenos o vacios: por incidencia,
+# (campos obligatorios, campos que deben ir vacios)
+_FIELD_RULES = {
+    "IN1": (_IN1234_REQUIRED, _IN1_FORBIDDEN),
+    "IN2": (_IN1234_REQUIRED, _IN234_FORBIDDEN),
+    "IN3": (_IN1234_REQUIRED, _IN234_FORBIDDEN),
+    "IN4": (_IN1234_REQUIRED, _IN234_FORBIDDEN),
+    "IN5": (_IN5_REQUIRED, _IN5_FORBIDDEN),
+    "IN6": ((), _IN6_FORBIDDEN),
+}
+
+
+def _field_table(kind: int) -> np.ndarray:
+    # Fila = incidencia de _FIELD_RULES, columna = campo de ALL_COLUMNS.
+    # La ultima fila (sin reglas) es la de las demas incidencias (indice -1)
+    table = np.zeros((len(_FIELD_RULES) + 1, len(ALL_COLUMNS)), dtype=bool)
+    for i, fields in enumerate(_FIELD_RULES.values()):
+        table[i, [ALL_COLUMNS.index(field) for field in fields[kind]]] = True
+    return table
+
+
+_REQUIRED_TABLE = _field_table(0)
+_FORBIDDEN_TABLE = _field_table(1)
+
+
+# Mensaje de campo con dato no permitido, si la regla no usa el generico
+_FORBIDDEN_MESSAGES = {
+    "IN1": "IN1: No debe haber dato aqui",
+    "IN6": "IN6: Solo se permiten datos en Trayecto, Puesto, Salida programada, Incidencia, Motivo y Observaciones",
+}
+
+
+def rule_fields_df(frame: NormalizedFrame) -> List[ColumnIssue]:
+    """Campos obligatorios / vacios de IN1..IN6 en una sola pasada sobre todas las filas."""
+    codes = pd.Index(list(_FIELD_RULES)).get_indexer(frame.incidence)
+    empty = frame.empty_columns(ALL_COLUMNS)
+    missing = empty & _REQUIRED_TABLE[codes]
+    filled = ~empty & _FORBIDDEN_TABLE[codes]
+    # Una mascara por regla y campo, con el prefijo de la regla en el mensaje;
+    # primero los obligatorios y despues los vacios, como en las reglas por fila
+    issues: List[ColumnIssue] = []
+    for i, rule in enumerate(_FIELD_RULES):
+        rows = codes == i
+        if not rows.any():
+            continue
+        issues.extend(
+            (field, f"{rule}: Campo obligatorio", missing[:, j] & rows)
+            for j, field in enumerate(ALL_COLUMNS) if _REQUIRED_TABLE[i, j]
+        )
+        forbidden = _FORBIDDEN_MESSAGES.get(rule, f"{rule}: Campo debe estar vacio")
+        issues.extend(
+            (field, forbidden, filled[:, j] & rows)
+            for j, field in enumerate(ALL_COLUMNS) if _FORBIDDEN_TABLE[i, j]
+        )
+    return issues
+
+
+# Orden esperado de la Salida real respecto a la programada, por incidencia
+_DEPARTURE_ORDER = {
+    "IN2": ("menor", np.less),
+    "IN3": ("mayor", np.greater),
+    "IN4": ("mayor", np.greater),
+}
+
+
+def rule_departure_order_df(frame: NormalizedFrame) -> List[ColumnIssue]:
+    """Salida real antes (IN2) o despues (IN3, IN4) de la Salida programada."""
+    delta = frame.departure_delta
+    invalid = np.isnan(delta)
+    issues: List[ColumnIssue] = []
+    for rule, (direction, in_order) in _DEPARTURE_ORDER.items():
+        rows = frame.incidence == rule
+        issues.append(("Salida real", f"{rule}: Salida real y programada deben ser validas", rows & invalid))
+        issues.append((
+            "Salida real",
+            f"{rule}: Salida real debe ser {direction} que Salida programada",
+            rows & ~invalid & ~in_order(delta, 0),
+        ))
+    return issues
+
+
+def rule_in7_df(frame: NormalizedFrame) -> List[ColumnIssue]:
+    motivo_main, motivo_sub = frame.motivo_codes
+    is_8_29 = (motivo_main == 8) & (motivo_sub == 29)
+    is_8_35 = (motivo_main == 8) & (motivo_sub == 35)
+
+    # Campos obligatorios: todos excepto Unidad saliente.
+    # Para motivo 8|35, Hora cambio tampoco es obligatoria (debe ir vacia).
+    issues = [
+        (field, message, mask & ~is_8_35 if field == "Hora cambio" else mask)
+        for field, message, mask in check_required_df(frame, _IN7_REQUIRED, "IN7")
+    ]
+
+    # Reglas segun motivo
+    hora_cambio = time_seconds(frame.data["Hora cambio"]).to_numpy()
+    issues.append(("Unidad saliente", "IN7: Campo debe estar vacio", ~frame.is_empty("Unidad saliente") & (is_8_35 | is_8_29)))
+    issues.append(("Hora cambio", "IN7: Campo debe estar vacio", ~frame.is_empty("Hora cambio") & is_8_35))
+    issues.append(("Hora cambio", "IN7: Hora cambio obligatorio para motivo 8-29", np.isnan(hora_cambio) & is_8_29))
+    return issues
+
+
+def rule_no_incidence_df(frame: NormalizedFrame) -> List[ColumnIssue]:
+    """Version por columnas de rule_no_incidence (solo filas sin incidencia)."""
+    applies = frame.incidence == ""
+    delta = frame.departure_delta
+    invalid = np.isnan(delta)
+    return [
+        ("Salida real", "SP/SR: Salida programada y real deben existir y ser validas", applies & invalid),
+        ("Salida real", "SP/SR: Salida programada debe ser igual a Salida real", applies & ~invalid & (delta != 0)),
+    ]
+
+
+def rule_motivo_robo_consola_df(frame: NormalizedFrame) -> List[ColumnIssue]:
+    """Version por columnas de rule_motivo_robo_consola."""
+    motivo_main, motivo_sub = frame.motivo_codes
+    is_8_65 = (motivo_main == 8) & (motivo_sub == 65)
+    is_text = map_unique(frame.data["Motivo"], lambda v: "robo de consola" in str(v).casefold()).astype(bool)
+    mask = ~frame.is_empty("Motivo") & (is_8_65 | is_text)
+    return [("Motivo", "Motivo 8|65 (Robo de consola) no permitido", mask)]
+
+
+def rule_cycle_df(frame: NormalizedFrame, cycle_averages: Dict[str, float]) -> List[ColumnIssue]:
+    """Version por columnas de rule_cycle."""
+    def average_for(value: Any) -> Optional[float]:
+        if is_empty(value):
+            return None
+        recorrido = str(value).strip()
+        return cycle_averages.get(recorrido) if recorrido else None
+
+    # Una busqueda en cycle_averages por Trayecto distinto (categoria), no por fila;
+    # sin promedio -> NaN, asi el resto son dos comparaciones de arreglos float
+    promedio = map_unique(frame.data["Trayecto"], average_for).astype("float64")
+    valid_average = ~np.isnan(promedio)
+    if not valid_average.any():
+        # Ningun Trayecto tiene promedio: no hace falta convertir Ciclo
+        return []
+    ciclo = frame.ciclo_number.to_numpy()
+    invalid = valid_average & np.isnan(ciclo)
+    exceeds = ciclo > promedio
+    return [
+        ("Ciclo", "Ciclo invalido; promedio permitido para el Trayecto", invalid),
+        ("Ciclo", "Ciclo supera promedio permitido para el Trayecto", exceeds),
+    ]
+
+
+def rule_min_cycle_df(frame: NormalizedFrame, min_minutes: float = 5.0) -> List[ColumnIssue]:
+    """Version por columnas de rule_min_cycle."""
+    return [("Ciclo", f"Ciclo menor a {min_minutes:0.0f} minutos", frame.ciclo_minutes < min_minutes)]
+
+
+def _route_limit_minutes(value: Any) -> float:
+    recorrido = normalize_recorrido(value)
+    key = _route_key(recorrido) if recorrido else None
+    return np.nan if key is None else ROUTE_CYCLE_LIMITS_MINUTES[key]
+
+
+def rule_cycle_route_limits_df(frame: NormalizedFrame) -> List[ColumnIssue]:
+    """Version por columnas de rule_cycle_route_limits."""
+    # Normalizacion y busqueda del limite una vez por Trayecto distinto;
+    # las filas toman su limite por codigo (NaN = sin limite o IN6)
+    limit = map_unique(frame.data["Trayecto"], _route_limit_minutes).astype("float64")
+    limit[frame.incidence == "IN6"] = np.nan
+    ciclo_minutes = frame.ciclo_minutes
+    return [
+        ("Ciclo", "Ciclo obligatorio para el Trayecto", ~np.isnan(limit) & np.isnan(ciclo_minutes)),
+        ("Ciclo", "Ciclo supera limite para el Trayecto", ciclo_minutes > limit),
+    ]
+
+
+# -------------------------
+# Controles de calidad por columnas
+# -------------------------
+
+def check_suspicious_placeholders_df(frame: NormalizedFrame) -> List[ColumnIssue]:
+    """Version por columnas de check_suspicious_placeholders."""
+    issues: List[ColumnIssue] = []
+    for field in ALL_COLUMNS:
+        mask = ~frame.is_empty(field) & frame.upper[field].isin(_SUSPICIOUS_VALUES).to_numpy(dtype=bool)
+        issues.append((field, "Valor sospechoso (parece un placeholder)", mask))
+    return issues
+
+
+def check_extra_spaces_df(frame: NormalizedFrame) -> List[ColumnIssue]:
+    """Version por columnas de check_extra_spaces."""
+    issues: List[ColumnIssue] = []
+    for field in ALL_COLUMNS:
+        # Celdas vacias como "" (sin NaN/NA): la mascara sale siempre booleana
+        text = as_text(frame.data[field]).mask(frame.is_empty(field), "")
+        mask = ~frame.is_empty(field) & (text != frame.stripped[field]).to_numpy(dtype=bool)
+        issues.append((field, "Error de digitación: contiene espacios al inicio o final", mask))
+    return issues
+
+
+def _has_invalid_chars(value: Any) -> bool:
+    return not _INVALID_CHARS.isdisjoint(str(value))
+
+
+def check_invalid_characters_df(frame: NormalizedFrame) -> List[ColumnIssue]:
+    """Version por columnas de check_invalid_characters."""
+    issues: List[ColumnIssue] = []
+    for field in _NUMERIC_FIELDS:
+        found = map_unique(frame.data[field], _has_invalid_chars).astype(bool)
+        issues.append((field, "Contiene caracteres inválidos", ~frame.is_empty(field) & found))
+    return issues
+
+
+def _int_or_nan(value: Any) -> float:
+    number = to_int(value)
+    return np.nan if number is None else float(number)
+
+
+def check_numeric_fields_validity_df(frame: NormalizedFrame) -> List[ColumnIssue]:
+    """Version por columnas de check_numeric_fields_validity."""
+    fields = tuple(_NUMERIC_RANGES)
+    # Matriz (fila, campo): to_int una vez por valor distinto (estas columnas se
+    # repiten mucho) y rangos comparados de una vez para los tres campos
+    num = np.column_stack([map_unique(frame.data[field], _int_or_nan).astype("float64") for field in fields])
+    invalid = ~frame.empty_columns(fields) & np.isnan(num)
+    out_of_range = (num < _NUMERIC_MIN) | (num > _NUMERIC_MAX)
+    issues: List[ColumnIssue] = []
+    for col, (field, (min_val, max_val)) in enumerate(_NUMERIC_RANGES.items()):
+        issues.append((field, "No es un número válido", invalid[:, col]))
+        issues.append((field, f"Número fuera de rango ({min_val}-{max_val})", out_of_range[:, col]))
+    return issues
+
+
+def _only_digits(value: Any) -> bool:
+    return str(value).strip().isdigit()
+
+
+def _too_short(value: Any) -> bool:
+    return len(str(value).strip()) < 2
+
+
+def _has_triple(value: Any) -> bool:
+    return _TRIPLE_RE.search(str(value).strip()) is not None
+
+
+def check_text_field_quality_df(frame: NormalizedFrame) -> List[ColumnIssue]:
+    """Version por columnas de check_text_field_quality."""
+    issues: List[ColumnIssue] = []
+    for field in _TEXT_FIELDS:
+        # Cada nombre/motivo distinto se revisa una vez (se repiten mucho)
+        values = frame.data[field]
+        filled = ~frame.is_empty(field)
+        if field == "Conductor":
+            issues.append((field, "El conductor debe ser un nombre, no solo números", filled & map_unique(values, _only_digits).astype(bool)))
+        issues.append((field, "Texto muy corto (posible error de digitación)", filled & map_unique(values, _too_short).astype(bool)))
+        issues.append((field, "Contiene caracteres repetidos excesivamente", filled & map_unique(values, _has_triple).astype(bool)))
+    return issues
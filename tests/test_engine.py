@@ -0,0 +1,216 @@
+import random
+import unittest
+from datetime import datetime, time
+
+import numpy as np
+import pandas as pd
+
+from app.validation import engine, rules
+from app.validation.rules import ALL_COLUMNS
+
+# Reglas por fila de cada incidencia (la version original del motor)
+INCIDENCE_RULES = {
+    "IN1": rules.rule_in1,
+    "IN2": rules.rule_in2,
+    "IN3": rules.rule_in3,
+    "IN4": rules.rule_in4,
+    "IN5": rules.rule_in5,
+    "IN6": rules.rule_in6,
+    "IN7": rules.rule_in7,
+}
+
+# Valores de prueba por columna: horas mal escritas, con zona horaria,
+# segundo 60 y sin ceros a la izquierda; motivos 8|29, 8|35 y 8|65
+TIMES = [
+    "05:30", "05:30:00", "14:00:00", "14:00:01", "13:59", "04:59:59", "2024-01-01 06:00:00",
+    "0.25", "abc", "", " ", "nan", None, "12:00:00.5", "7:05", "24:00",
+    "06:00:00Z", "2024-01-01T06:00:00+05:00", "14:00:00-03:00",
+    "05:30:60", "2024-01-01 23:59:61", "5:3:7", "5:7", "05:7:3", "05:30 ",
+]
+INCIDENCES = ["IN1 - Retraso", "IN2", "in3 - x", "IN4", "IN5", "IN6 - y", "IN7", "IN8", "", None, " IN2", "nan", "in7"]
+MOTIVOS = ["8|29", "8-35", "8 / 65", "Robo de consola", "8|35 Cambio", "  8 | 29 ", "8|65", "abc", "", None, "12"]
+CICLOS = ["00:45:00", "0.03", "50", "1:55", "abc", "3", "00:04:00", "02:30:00", "0.5", "", None, "4.9", "-1"]
+ROUTES = [*rules.ROUTE_CYCLE_LIMITS, "Terminal Guasmo - Terminal Guasmo-S1", "T3 – R2  Iguanas", "desconocida", "", None]
+NUMBERS = ["1", "0", "12", " 5", "abc", "", None, "1.0", "N/A", "#12", "1000", "100000", "-3"]
+TEXTS = ["Juan Perez", "1234", "X", "", None, "N/A", "  Juan", "Ana!", "aaab", "Pedro ", "ERROR", "---"]
+OPTIONAL = ["", None, None, "3"]
+
+POOLS = {
+    "Trayecto": ROUTES,
+    "Puesto": NUMBERS,
+    "Unidad": NUMBERS,
+    "Salida programada": TIMES,
+    "Salida real": TIMES,
+    "Hora de llegada": TIMES,
+    "Ciclo": CICLOS,
+    "Unidad saliente": OPTIONAL,
+    "Hora cambio": TIMES + [None, None],
+    "Parada": OPTIONAL,
+    "Incidencia": INCIDENCES,
+    "Motivo": MOTIVOS,
+    "Código": NUMBERS,
+    "Conductor": TEXTS,
+    "Observaciones": TEXTS,
+}
+
+CYCLE_AVERAGES = {"T3 – R2  Iguanas": 30.0, "desconocida": 0.02, "t1-playita": 60.0}
+
+
+def sample_frame(seed: int, rows: int = 400, mixed: bool = False) -> pd.DataFrame:
+    """Filas aleatorias (reproducibles) con los valores de POOLS."""
+    rnd = random.Random(seed)
+    df = pd.DataFrame({column: [rnd.choice(POOLS[column]) for _ in range(rows)] for column in ALL_COLUMNS}, dtype=object)
+    if mixed:
+        # Celdas como las deja Excel: horas, fechas y numeros
+        for column in ("Salida programada", "Salida real", "Ciclo"):
+            df[column] = [rnd.choice([time(6, 0), time(14, 0), 0.3, np.nan, datetime(2024, 1, 1, 9, 15), 45.0, v]) for v in df[column]]
+        df["Motivo"] = [rnd.choice([829.0, 865, np.nan, v]) for v in df["Motivo"]]
+        df["Puesto"] = [rnd.choice([1, 0, 5.0, np.nan, v]) for v in df["Puesto"]]
+    return df
+
+
+def _result(idx, row, issues):
+    if not issues:
+        return None
+    problem_details = []
+    for field, _message in issues:
+        if field not in problem_details:
+            problem_details.append(field)
+    row_values = {col: "" if rules.is_empty(row.get(col)) else str(row.get(col)) for col in ALL_COLUMNS}
+    return (idx + 2, row_values, problem_details)
+
+
+# Controles de calidad por fila, en el orden de engine.QUALITY_CHECKS
+QUALITY_CHECKS = (
+    rules.check_suspicious_placeholders,
+    rules.check_extra_spaces,
+    rules.check_invalid_characters,
+    rules.check_numeric_fields_validity,
+    rules.check_text_field_quality,
+)
+
+
+def scalar_validate(df, cycle_averages=None, quality_checks=False):
+    """Motor fila por fila con las reglas escalares de rules."""
+    results = []
+    for idx, row in df.iterrows():
+        issues = []
+        incidence = rules.normalize_incidence(row.get("Incidencia"))
+        if incidence:
+            rule_fn = INCIDENCE_RULES.get(incidence)
+            if rule_fn is not None:
+                issues.extend(rule_fn(row))
+        else:
+            issues.extend(rules.rule_no_incidence(row))
+        issues.extend(rules.rule_motivo_robo_consola(row))
+        if cycle_averages:
+            issues.extend(rules.rule_cycle(row, cycle_averages))
+        issues.extend(rules.rule_min_cycle(row))
+        if quality_checks:
+            for check in QUALITY_CHECKS:
+                issues.extend(check(row))
+        results.append(_result(idx, row, issues))
+    return [result for result in results if result]
+
+
+def scalar_validate_cycles(df):
+    results = []
+    for idx, row in df.iterrows():
+        issues = [
+            *rules.rule_cycle_route_limits(row),
+            *rules.rule_motivo_robo_consola(row),
+            *rules.rule_min_cycle(row),
+        ]
+        results.append(_result(idx, row, issues))
+    return [result for result in results if result]
+
+
+def _as_tuples(results):
+    return [(r.row_number, r.row_values, r.problem_details) for r in results]
+
+
+class ValidateDataframeTest(unittest.TestCase):
+    def test_matches_scalar_rules(self):
+        for seed in range(4):
+            for mixed in (False, True):
+                df = sample_frame(seed, mixed=mixed)
+                with self.subTest(seed=seed, mixed=mixed):
+                    self.assertEqual(_as_tuples(engine.validate_dataframe(df)), scalar_validate(df))
+                    self.assertEqual(
+                        _as_tuples(engine.validate_dataframe(df, CYCLE_AVERAGES)),
+                        scalar_validate(df, CYCLE_AVERAGES),
+                    )
+
+    def test_cycles_match_scalar_rules(self):
+        for seed in range(4):
+            for mixed in (False, True):
+                df = sample_frame(seed, mixed=mixed)
+                with self.subTest(seed=seed, mixed=mixed):
+                    self.assertEqual(_as_tuples(engine.validate_cycles_dataframe(df)), scalar_validate_cycles(df))
+
+    def test_fixture_covers_every_rule(self):
+        # La comparacion solo vale si todas las reglas se disparan en el fixture
+        df = sample_frame(0)
+        messages = set()
+        for _, row in df.iterrows():
+            incidence = rules.normalize_incidence(row.get("Incidencia"))
+            rule_fn = INCIDENCE_RULES.get(incidence, rules.rule_no_incidence if not incidence else None)
+            if rule_fn is not None:
+                messages.update(message for _field, message in rule_fn(row))
+            messages.update(message for _field, message in rules.rule_motivo_robo_consola(row))
+            messages.update(message for _field, message in rules.rule_cycle_route_limits(row))
+        for prefix in ("IN1:", "IN2:", "IN3:", "IN4:", "IN5:", "IN6:", "IN7:", "SP/SR:", "Motivo 8|65", "Ciclo supera limite"):
+            self.assertTrue(any(m.startswith(prefix) for m in messages), prefix)
+        self.assertIn("IN7: Hora cambio obligatorio para motivo 8-29", messages)
+
+
+class ColumnRulesTest(unittest.TestCase):
+    def test_incidence_messages_match_scalar_rules(self):
+        # Mismos (campo, mensaje) por fila que rule_in1..rule_in7 y rule_no_incidence
+        for mixed in (False, True):
+            df = sample_frame(1, mixed=mixed)
+            frame = rules.NormalizedFrame.from_dataframe(df)
+            issues = [*rules.rule_fields_df(frame), *rules.rule_departure_order_df(frame), *rules.rule_no_incidence_df(frame)]
+            positions = np.flatnonzero(frame.incidence == "IN7")
+            issues.extend(
+                (field, message, np.isin(np.arange(len(df)), positions[mask]))
+                for field, message, mask in rules.rule_in7_df(frame.take(positions))
+            )
+            for i, (_, row) in enumerate(df.iterrows()):
+                incidence = rules.normalize_incidence(row.get("Incidencia"))
+                rule_fn = INCIDENCE_RULES.get(incidence, rules.rule_no_incidence if not incidence else None)
+                expected = sorted(rule_fn(row)) if rule_fn is not None else []
+                actual = sorted((field, message) for field, message, mask in issues if mask[i])
+                with self.subTest(mixed=mixed, row=i, incidence=incidence):
+                    self.assertEqual(actual, expected)
+
+
+class QualityChecksTest(unittest.TestCase):
+    def test_column_checks_match_scalar_checks(self):
+        # Mismos campos, en el mismo orden, que cada check_* por fila
+        for mixed in (False, True):
+            df = sample_frame(2, mixed=mixed)
+            frame = rules.NormalizedFrame.from_dataframe(df)
+            for column_check, scalar_check in zip(engine.QUALITY_CHECKS, QUALITY_CHECKS):
+                issues = column_check(frame)
+                for i, (_, row) in enumerate(df.iterrows()):
+                    expected = [field for field, _message in scalar_check(row)]
+                    actual = [field for field, _message, mask in issues if mask[i]]
+                    with self.subTest(mixed=mixed, check=scalar_check.__name__, row=i):
+                        self.assertEqual(actual, expected)
+
+    def test_validate_dataframe_with_quality_checks(self):
+        for mixed in (False, True):
+            df = sample_frame(3, mixed=mixed)
+            with self.subTest(mixed=mixed):
+                expected = scalar_validate(df, CYCLE_AVERAGES, quality_checks=True)
+                self.assertNotEqual(expected, scalar_validate(df, CYCLE_AVERAGES))
+                self.assertEqual(_as_tuples(engine.validate_dataframe(df, CYCLE_AVERAGES, quality_checks=True)), expected)
+                self.assertEqual(
+                    _as_tuples(engine.validate_dataframe(df, CYCLE_AVERAGES, npartitions=2, quality_checks=True)),
+                    expected,
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
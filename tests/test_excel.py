@@ -0,0 +1,49 @@
+import os
+import tempfile
+import unittest
+from datetime import timedelta
+
+import openpyxl
+
+from app.validation import engine, excel
+from app.validation.rules import ALL_COLUMNS
+
+
+def _write_workbook(path, rows):
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.append(ALL_COLUMNS)
+    for row in rows:
+        ws.append([row.get(column) for column in ALL_COLUMNS])
+        for cell in ws[ws.max_row]:
+            if isinstance(cell.value, timedelta):
+                # Formato de duracion de Excel
+                cell.number_format = "[h]:mm:ss"
+    wb.save(path)
+
+
+class ReadRecordsTest(unittest.TestCase):
+    def test_duration_cells_are_read_as_clock_text(self):
+        # Ciclo con formato de duracion: 20, 25 y 10 minutos, bajo el limite de 30 de T1 - Playita
+        base = {
+            "Trayecto": "T1 - Playita",
+            "Puesto": "1",
+            "Unidad": "12",
+            "Salida programada": "06:00:00",
+            "Salida real": "06:00:00",
+            "Motivo": "8|29",
+            "Código": "5",
+            "Conductor": "Juan Perez",
+        }
+        rows = [{**base, "Ciclo": timedelta(minutes=minutes)} for minutes in (20, 25, 10)]
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "ciclos.xlsx")
+            _write_workbook(path, rows)
+            df = excel.read_records(path)
+
+        self.assertEqual(df["Ciclo"].tolist(), ["0:20:00", "0:25:00", "0:10:00"])
+        self.assertEqual(engine.validate_cycles_dataframe(df), [])
+
+
+if __name__ == "__main__":
+    unittest.main()